@@ -11,11 +11,13 @@ from textual.binding import Binding
 from textual.screen import Screen
 
 from .models import LightroomAdjustments, PresetMetadata
-from .metadata import MetadataExtractor
+from .metadata import PREFETCH_BATCH_SIZE, MetadataExtractor
 from .xmp import XMPGenerator
-from .fetcher import ImageFetcher
 from .widgets import AdjustmentsPanel
 
+# Supported image file extensions, compared in lower case
+JPEG_SUFFIXES = frozenset({".jpg", ".jpeg"})
+
 
 class ImageListScreen(Screen):
     """Screen for selecting images to process."""
@@ -48,16 +50,14 @@ class ImageListScreen(Screen):
 
     def on_mount(self) -> None:
         """Handle screen mount."""
+        self._image_list = self.query_one("#image-list", Static)
         self._update_image_list()
 
     def _update_image_list(self) -> None:
         """Update the list of images."""
-        lines = []
-        for i, path in enumerate(self.image_paths, 1):
-            lines.append(f"{i}. {path.name}")
-
-        image_list = self.query_one("#image-list", Static)
-        image_list.update("\n".join(lines))
+        self._image_list.update(
+            "\n".join(f"{i}. {path.name}" for i, path in enumerate(self.image_paths, 1))
+        )
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -69,7 +69,7 @@ class ImageListScreen(Screen):
     async def _process_images(self) -> None:
         """Process all images and switch to viewing screen."""
         if self.image_paths:
-            self.app.push_screen(ImageViewScreen(self.image_paths))
+            self.app.push_screen(ImageViewScreen(self.image_paths, self.app.extractor))
 
     def action_back(self) -> None:
         """Go back to previous screen."""
@@ -91,12 +91,17 @@ class ImageViewScreen(Screen):
         Binding("escape", "back", "Back", priority=True),
     ]
 
-    def __init__(self, image_paths: List[Path], **kwargs):
+    def __init__(
+        self,
+        image_paths: List[Path],
+        extractor: Optional[MetadataExtractor] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.image_paths = image_paths
         self.current_index = 0
         self.adjustments: Optional[LightroomAdjustments] = None
-        self.extractor = MetadataExtractor()
+        self.extractor = extractor or MetadataExtractor()
         self.generator = XMPGenerator()
 
     def compose(self) -> ComposeResult:
@@ -119,33 +124,74 @@ class ImageViewScreen(Screen):
 
     def on_mount(self) -> None:
         """Handle screen mount."""
-        self._load_current_image()
+        # Look widgets up once rather than on every navigation
+        self._info_label = self.query_one("#image-info", Label)
+        self._panel = self.query_one("#adjustments-panel", Static)
+        self._show_current_image()
+
+    def _show_current_image(self) -> None:
+        """Start loading the current image, replacing any load still in progress."""
+        self.run_worker(
+            self._load_current_image(), group="load", exclusive=True, exit_on_error=False
+        )
 
-    def _load_current_image(self) -> None:
-        """Load and display the current image's adjustments."""
+    def images_added(self) -> None:
+        """Refresh the screen after images were appended to image_paths."""
+        if not self.is_mounted:
+            # on_mount will show the current image
+            return
+        if len(self.image_paths) == 1:
+            # The first image arrived while the screen was waiting for it
+            self._show_current_image()
+        else:
+            self._update_image_info()
+
+    def _update_image_info(self) -> None:
+        """Update the label naming the current image."""
         if not self.image_paths:
+            self._info_label.update("[dim]Waiting for downloads…[/dim]")
             return
 
         current_path = self.image_paths[self.current_index]
-
-        # Update info label
-        info_label = self.query_one("#image-info", Label)
-        info_label.update(
+        self._info_label.update(
             f"[bold]Image {self.current_index + 1} of {len(self.image_paths)}:[/bold] "
             f"[cyan]{current_path.name}[/cyan]"
         )
 
-        # Extract metadata
-        self.adjustments = self.extractor.extract(current_path)
+    async def _load_current_image(self) -> None:
+        """Load and display the current image's adjustments."""
+        self._update_image_info()
+        if not self.image_paths:
+            return
+
+        current_path = self.image_paths[self.current_index]
+
+        panel = self._panel
+        panel.update("[dim]Loading…[/dim]")
+        self.adjustments = None
+
+        # Extract metadata in a thread so ExifTool doesn't block the event loop
+        self.adjustments = await asyncio.to_thread(self.extractor.extract, current_path)
 
         # Display adjustments
-        panel = self.query_one("#adjustments-panel", Static)
         if self.adjustments and self.adjustments.has_adjustments():
             adjustments_widget = AdjustmentsPanel(self.adjustments)
             panel.update(adjustments_widget.render())
         else:
             panel.update("[yellow]No Lightroom adjustments found in this image[/yellow]")
 
+        self._prefetch_neighbors()
+
+    def _prefetch_neighbors(self) -> None:
+        """Extract the next and previous images in the background to speed up navigation."""
+        for index in (self.current_index + 1, self.current_index - 1):
+            if 0 <= index < len(self.image_paths):
+                self.run_worker(
+                    asyncio.to_thread(self.extractor.extract, self.image_paths[index]),
+                    group="prefetch",
+                    exit_on_error=False,
+                )
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "next-btn":
@@ -159,13 +205,13 @@ class ImageViewScreen(Screen):
         """Move to next image."""
         if self.current_index < len(self.image_paths) - 1:
             self.current_index += 1
-            self._load_current_image()
+            self._show_current_image()
 
     def action_prev_image(self) -> None:
         """Move to previous image."""
         if self.current_index > 0:
             self.current_index -= 1
-            self._load_current_image()
+            self._show_current_image()
 
     def action_export(self) -> None:
         """Export current adjustments as XMP preset."""
@@ -259,13 +305,73 @@ class PresetifyApp(App):
 
     TITLE = "Presetify - Lightroom Preset Extractor"
 
-    def __init__(self, image_paths: List[Path], **kwargs):
+    def __init__(self, image_paths: List[Path], urls: Optional[List[str]] = None, **kwargs):
+        """
+        Create the application.
+
+        Args:
+            image_paths: Local images to show
+            urls: Image URLs to download while the app runs; each image is
+                added to the view as soon as it has been saved
+        """
         super().__init__(**kwargs)
         self.image_paths = image_paths
+        self.urls = urls or []
+        # Shared by all screens so ExifTool runs as a single long-lived process
+        self.extractor = MetadataExtractor()
+        self.view_screen: Optional[ImageViewScreen] = None
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Handle app mount."""
-        if self.image_paths:
-            self.push_screen(ImageViewScreen(self.image_paths))
-        else:
+        if not self.image_paths and not self.urls:
             self.exit(message="No images provided")
+            return
+
+        if self.image_paths:
+            self.run_worker(self._prefetch_metadata(), group="prefetch", exit_on_error=False)
+
+        self.view_screen = ImageViewScreen(self.image_paths, self.extractor)
+        # Downloads may end the app, which must not happen while the view is mounting
+        await self.push_screen(self.view_screen)
+
+        if self.urls:
+            self.run_worker(self._download_images(), group="download", exit_on_error=False)
+
+    async def _prefetch_metadata(self) -> None:
+        """Read every image's metadata up front, one batch per thread call."""
+        # Quitting cancels this worker, so it stops after the batch in progress
+        # instead of keeping the app open until every image is read
+        image_paths = list(self.image_paths)
+        for start in range(0, len(image_paths), PREFETCH_BATCH_SIZE):
+            batch = image_paths[start : start + PREFETCH_BATCH_SIZE]
+            await asyncio.to_thread(self.extractor.prefetch, batch)
+
+    async def _download_images(self) -> None:
+        """Download the URL images, adding each one to the view as it arrives."""
+        # httpx is slow to import, so only load it when there are URLs
+        from .fetcher import ImageFetcher
+
+        try:
+            async with ImageFetcher() as fetcher:
+                async for url, path in fetcher.fetch_as_completed(self.urls):
+                    if path is None:
+                        self.notify(f"Failed to download {url}", severity="error")
+                    elif path.suffix.lower() not in JPEG_SUFFIXES:
+                        path.unlink(missing_ok=True)
+                        self.notify(f"Skipped {url}: only JPEG is supported", severity="warning")
+                    else:
+                        self.image_paths.append(path)
+                        # Read its metadata now, while other downloads continue
+                        self.run_worker(
+                            asyncio.to_thread(self.extractor.extract, path),
+                            group="prefetch",
+                            exit_on_error=False,
+                        )
+                        if self.view_screen is not None:
+                            self.view_screen.images_added()
+        except Exception as e:
+            self.notify(f"Error downloading images: {e}", severity="error")
+
+        # With nothing to show, the view would wait forever
+        if not self.image_paths:
+            self.exit(return_code=1, message="Error: No images could be downloaded")
@@ -1,13 +1,11 @@
 """Command-line interface for Presetify."""
 
-import asyncio
+import fnmatch
+import os
 import sys
 from pathlib import Path
 from typing import List
 
-from .app import PresetifyApp
-from .fetcher import ImageFetcher
-
 
 def parse_arguments() -> List[Path]:
     """
@@ -29,6 +27,8 @@ def parse_arguments() -> List[Path]:
 
     image_paths = []
     urls = []
+    # File names per directory, so each directory is listed only once
+    listings: dict[Path, List[str]] = {}
 
     for arg in args:
         if arg.startswith(("http://", "https://")):
@@ -41,40 +41,22 @@ def parse_arguments() -> List[Path]:
             else:
                 # Try to expand glob
                 parent = path.parent if path.parent.exists() else Path.cwd()
-                matches = list(parent.glob(path.name))
-                image_paths.extend(p for p in matches if p.is_file())
+                if parent not in listings:
+                    listings[parent] = _list_files(parent)
+                matches = fnmatch.filter(listings[parent], path.name)
+                image_paths.extend(parent / name for name in matches)
 
     return image_paths, urls
 
 
-async def fetch_urls(urls: List[str]) -> List[Path]:
-    """
-    Download images from URLs.
-
-    Args:
-        urls: List of image URLs
-
-    Returns:
-        List of downloaded image paths
-    """
-    if not urls:
+def _list_files(directory: Path) -> List[str]:
+    """Return the names of the files in a directory, or [] if it can't be read."""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+    except OSError:
         return []
 
-    print(f"Downloading {len(urls)} images from URLs...")
-    fetcher = ImageFetcher()
-    paths = []
-
-    for url in urls:
-        print(f"  Fetching: {url}")
-        path = await fetcher.fetch(url)
-        if path:
-            paths.append(path)
-            print(f"    ✓ Saved to {path}")
-        else:
-            print(f"    ✗ Failed to download")
-
-    return paths
-
 
 def main():
     """Main entry point for the CLI."""
@@ -82,29 +64,31 @@ def main():
         # Parse arguments
         image_paths, urls = parse_arguments()
 
-        # Download URLs if any
-        if urls:
-            downloaded_paths = asyncio.run(fetch_urls(urls))
-            image_paths.extend(downloaded_paths)
+        # Imported here so the usage message doesn't pay for loading Textual
+        from .app import JPEG_SUFFIXES, PresetifyApp
 
-        if not image_paths:
+        if not image_paths and not urls:
             print("Error: No valid image files found")
             sys.exit(1)
 
         # Filter for supported image formats
-        supported_extensions = {".jpg", ".jpeg", ".JPG", ".JPEG"}
-        valid_images = [p for p in image_paths if p.suffix in supported_extensions]
+        valid_images = [p for p in image_paths if p.suffix.lower() in JPEG_SUFFIXES]
 
-        if not valid_images:
+        if not valid_images and not urls:
             print("Error: No supported image files found (only JPEG supported)")
             sys.exit(1)
 
         print(f"\nFound {len(valid_images)} image(s) to process")
+        if urls:
+            # URLs are downloaded by the TUI while it runs
+            print(f"Downloading {len(urls)} image(s) from URLs in the background")
         print("Starting Presetify TUI...\n")
 
         # Launch TUI application
-        app = PresetifyApp(valid_images)
+        app = PresetifyApp(valid_images, urls=urls)
         app.run()
+        if app.return_code:
+            sys.exit(app.return_code)
 
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
@@ -1,22 +1,60 @@
 """Download images from URLs."""
 
+import asyncio
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Iterable, Optional, Tuple
 import httpx
 
+# Size of the chunks streamed from the response body to disk
+CHUNK_SIZE = 64 * 1024
+
+# Default number of download workers used by fetch_as_completed()
+MAX_CONCURRENT_DOWNLOADS = 5
+
 
 class ImageFetcher:
-    """Download images from URLs and save to temporary files."""
+    """
+    Download images from URLs and save to temporary files.
+
+    Use as an async context manager so that a single HTTP client (and its
+    connection pool) is shared by every fetch:
 
-    def __init__(self, timeout: int = 30):
+        async with ImageFetcher() as fetcher:
+            path = await fetcher.fetch(url)
+    """
+
+    def __init__(self, timeout: int = 30, max_connections: int = 20):
         """
         Initialize the image fetcher.
 
         Args:
             timeout: Request timeout in seconds
+            max_connections: Maximum number of pooled connections
         """
         self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "ImageFetcher":
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch(self, url: str) -> Optional[Path]:
         """
@@ -28,9 +66,13 @@ class ImageFetcher:
         Returns:
             Path to the temporary file, or None if download failed
         """
+        if self._client is None:
+            raise RuntimeError("ImageFetcher must be used as an async context manager")
+
+        temp_path = None
+        completed = False
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, follow_redirects=True)
+            async with self._client.stream("GET", url, follow_redirects=True) as response:
                 response.raise_for_status()
 
                 # Determine file extension from content-type or URL
@@ -41,23 +83,72 @@ class ImageFetcher:
                     # Try to get from URL
                     extension = Path(url).suffix or ".jpg"
 
-                # Create temporary file
-                temp_file = tempfile.NamedTemporaryFile(
+                # Stream the body to a temporary file chunk by chunk, keeping
+                # file writes off the event loop
+                with tempfile.NamedTemporaryFile(
                     delete=False, suffix=extension, prefix="presetify_"
-                )
-                temp_path = Path(temp_file.name)
+                ) as temp_file:
+                    temp_path = Path(temp_file.name)
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        await asyncio.to_thread(temp_file.write, chunk)
 
-                # Write content
-                temp_path.write_bytes(response.content)
-
-                return temp_path
+            completed = True
+            return temp_path
 
         except httpx.HTTPError as e:
             print(f"HTTP error downloading {url}: {e}")
-            return None
         except Exception as e:
             print(f"Error downloading {url}: {e}")
-            return None
+        finally:
+            # Don't leave partial downloads behind, also when cancelled
+            if not completed and temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+
+        return None
+
+    async def fetch_as_completed(
+        self, urls: Iterable[str], workers: int = MAX_CONCURRENT_DOWNLOADS
+    ) -> AsyncIterator[Tuple[str, Optional[Path]]]:
+        """
+        Download images concurrently, yielding each one as soon as it is saved.
+
+        A fixed pool of worker tasks pulls URLs from a queue, so at most
+        ``workers`` downloads are in flight at once. Results arrive in
+        completion order, not in the order of ``urls``.
+
+        Args:
+            urls: URLs of the images to download
+            workers: Number of concurrent downloads
+
+        Yields:
+            Tuples of (url, path), where path is None if the download failed
+        """
+        pending: asyncio.Queue[str] = asyncio.Queue()
+        for url in urls:
+            pending.put_nowait(url)
+        total = pending.qsize()
+
+        ready: asyncio.Queue[Tuple[str, Optional[Path]]] = asyncio.Queue()
+
+        async def worker() -> None:
+            while not pending.empty():
+                url = pending.get_nowait()
+                ready.put_nowait((url, await self.fetch(url)))
+
+        tasks = [asyncio.create_task(worker()) for _ in range(min(workers, total))]
+        try:
+            for _ in range(total):
+                yield await ready.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled downloads remove their partial files before returning
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Downloads that finished but were never yielded have no other owner
+            while not ready.empty():
+                _, path = ready.get_nowait()
+                if path is not None:
+                    path.unlink(missing_ok=True)
 
     def _get_extension_from_content_type(self, content_type: str) -> str:
         """Get file extension from HTTP content-type header."""
@@ -1,12 +1,25 @@
 """Extract Lightroom metadata from images."""
 
-import json
+import atexit
+import contextlib
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 import exiftool
 
 from .models import LightroomAdjustments, ToneCurve
 
+# Number of files read per ExifTool call when prefetching; keeps the process
+# free for interactive extract() calls between batches
+PREFETCH_BATCH_SIZE = 32
+
+# Arguments the ExifTool process is started with: group-prefixed tag names
+# ("XMP:Exposure2012"), numeric values, and skipping MakerNotes and trailers
+EXIFTOOL_ARGS = ["-G", "-n", "-fast2"]
+
+# Color channels of Lightroom's HSL panel
+HSL_COLORS = ("Red", "Orange", "Yellow", "Green", "Aqua", "Blue", "Purple", "Magenta")
+
 
 class MetadataExtractor:
     """Extract Lightroom adjustments from image metadata using ExifTool."""
@@ -37,10 +50,112 @@ class MetadataExtractor:
         "XMP:ToneCurvePV2012Blue": "tone_curve_blue",
     }
 
+    # HSL tags as (XMP tag, color key, LightroomAdjustments dict attribute)
+    HSL_TAGS = tuple(
+        (f"XMP:{kind}Adjustment{color}", color.lower(), attr_name)
+        for color in HSL_COLORS
+        for kind, attr_name in (
+            ("Hue", "hue_adjustments"),
+            ("Saturation", "saturation_adjustments"),
+            ("Luminance", "luminance_adjustments"),
+        )
+    )
+
+    # Every tag requested from ExifTool; other tags are not read at all
+    EXIFTOOL_TAGS = tuple(LR_TAGS) + tuple(xmp_tag for xmp_tag, _, _ in HSL_TAGS)
+
+    def __init__(self):
+        """Initialize the extractor; ExifTool is started on first use."""
+        self._et: Optional[exiftool.ExifToolHelper] = None
+        # Extracted adjustments keyed by (path, mtime) so edited files are re-read
+        self._mem: dict[tuple[str, int], LightroomAdjustments] = {}
+        # The ExifTool process handles one command at a time; extract() and
+        # prefetch() may be called from worker threads
+        self._lock = threading.Condition()
+        self._busy = False
+        # extract() calls waiting for ExifTool, which go ahead of prefetch batches
+        self._waiting = 0
+
+    def _exiftool(self) -> exiftool.ExifToolHelper:
+        """Return the shared ExifTool process, starting it if needed."""
+        if self._et is None:
+            self._et = exiftool.ExifToolHelper(common_args=EXIFTOOL_ARGS)
+            self._et.run()
+            atexit.register(self.close)
+        return self._et
+
+    @contextlib.contextmanager
+    def _exiftool_turn(self, interactive: bool) -> Iterator[None]:
+        """
+        Hold the ExifTool process for one command.
+
+        A plain lock is not fair, so a prefetch loop could take the process
+        again before a waiting extract() gets it. Prefetch batches therefore
+        also wait until no interactive call is queued.
+
+        Args:
+            interactive: True for extract(), which takes precedence
+        """
+        with self._lock:
+            if interactive:
+                self._waiting += 1
+                self._lock.wait_for(lambda: not self._busy)
+                self._waiting -= 1
+            else:
+                self._lock.wait_for(lambda: not self._busy and not self._waiting)
+            self._busy = True
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._busy = False
+                self._lock.notify_all()
+
+    def close(self) -> None:
+        """Terminate the shared ExifTool process."""
+        if self._et is not None:
+            self._et.terminate()
+            self._et = None
+
+    def prefetch(self, image_paths: Iterable[str | Path]) -> None:
+        """
+        Read metadata for many images with a single ExifTool call.
+
+        Results are cached so that later calls to extract() for these images
+        don't need another round trip to ExifTool. Files are read in batches
+        of PREFETCH_BATCH_SIZE.
+
+        Args:
+            image_paths: Paths of the image files to read
+        """
+        keys = {}
+        for image_path in image_paths:
+            key = self._cache_key(Path(image_path))
+            if key is not None and key not in self._mem:
+                keys[key[0]] = key
+        batch = list(keys)
+        for start in range(0, len(batch), PREFETCH_BATCH_SIZE):
+            files = batch[start : start + PREFETCH_BATCH_SIZE]
+            try:
+                with self._exiftool_turn(interactive=False):
+                    metadata = self._exiftool().get_tags(files, self.EXIFTOOL_TAGS)
+            except Exception as e:
+                # These images are read one at a time by extract() instead
+                print(f"Error prefetching metadata: {e}")
+                continue
+
+            for data in metadata:
+                key = keys.get(str(Path(data.get("SourceFile", ""))))
+                if key is not None:
+                    self._mem[key] = self._build_adjustments(Path(key[0]), data)
+
     def extract(self, image_path: str | Path) -> LightroomAdjustments:
         """
         Extract Lightroom adjustments from an image file.
 
+        Results are memoized per file path and modification time, so
+        revisiting an unchanged image does not call ExifTool again.
+
         Args:
             image_path: Path to the image file
 
@@ -48,34 +163,57 @@ class MetadataExtractor:
             LightroomAdjustments object with extracted data
         """
         image_path = Path(image_path)
-        adjustments = LightroomAdjustments(source_file=str(image_path))
+        key = self._cache_key(image_path)
+        if key is not None and key in self._mem:
+            return self._mem[key]
 
         try:
-            with exiftool.ExifToolHelper() as et:
-                metadata = et.get_metadata(str(image_path))
+            with self._exiftool_turn(interactive=True):
+                # A concurrent prefetch() may have filled the cache meanwhile
+                if key is not None and key in self._mem:
+                    return self._mem[key]
+                metadata = self._exiftool().get_tags(str(image_path), self.EXIFTOOL_TAGS)
 
-                if not metadata:
-                    return adjustments
+            if not metadata:
+                return LightroomAdjustments(source_file=str(image_path))
 
-                # ExifTool returns a list with one dict per file
-                data = metadata[0] if isinstance(metadata, list) else metadata
+            # ExifTool returns a list with one dict per file
+            data = metadata[0] if isinstance(metadata, list) else metadata
+            adjustments = self._build_adjustments(image_path, data)
 
-                # Extract basic adjustments
-                for xmp_tag, attr_name in self.LR_TAGS.items():
-                    if xmp_tag in data:
-                        value = data[xmp_tag]
+        except Exception as e:
+            print(f"Error extracting metadata from {image_path}: {e}")
+            return LightroomAdjustments(source_file=str(image_path))
 
-                        # Handle tone curve specially
-                        if attr_name == "tone_curve":
-                            adjustments.tone_curve = self._parse_tone_curve(value)
-                        else:
-                            setattr(adjustments, attr_name, value)
+        if key is not None:
+            self._mem[key] = adjustments
+        return adjustments
 
-                # Extract HSL adjustments
-                self._extract_hsl_adjustments(data, adjustments)
+    @staticmethod
+    def _cache_key(image_path: Path) -> Optional[tuple[str, int]]:
+        """Return the memoization key for an image, or None if it can't be stat'ed."""
+        try:
+            return str(image_path), image_path.stat().st_mtime_ns
+        except OSError:
+            return None
 
-        except Exception as e:
-            print(f"Error extracting metadata from {image_path}: {e}")
+    def _build_adjustments(self, image_path: Path, data: dict) -> LightroomAdjustments:
+        """Build adjustments from one image's ExifTool tag dictionary."""
+        adjustments = LightroomAdjustments(source_file=str(image_path))
+
+        # Extract basic adjustments
+        for xmp_tag, attr_name in self.LR_TAGS.items():
+            if xmp_tag in data:
+                value = data[xmp_tag]
+
+                # Handle tone curve specially
+                if attr_name == "tone_curve":
+                    adjustments.tone_curve = self._parse_tone_curve(value)
+                else:
+                    setattr(adjustments, attr_name, value)
+
+        # Extract HSL adjustments
+        self._extract_hsl_adjustments(data, adjustments)
 
         return adjustments
 
@@ -90,19 +228,16 @@ class MetadataExtractor:
             return None
 
         try:
-            # If it's a string, split it
-            if isinstance(curve_data, str):
-                values = [int(v.strip()) for v in curve_data.split(",")]
-            elif isinstance(curve_data, list):
-                values = [int(v) for v in curve_data]
-            else:
+            # ExifTool returns a list with one "x, y" string (or number) per
+            # point; join it so both forms are parsed in a single pass
+            if isinstance(curve_data, list):
+                curve_data = ",".join(map(str, curve_data))
+            elif not isinstance(curve_data, str):
                 return None
 
-            # Parse pairs of (input, output)
-            points = []
-            for i in range(0, len(values), 2):
-                if i + 1 < len(values):
-                    points.append((values[i], values[i + 1]))
+            # Parse pairs of (input, output); int() ignores surrounding spaces
+            values = map(int, curve_data.split(","))
+            points = list(zip(values, values))
 
             return ToneCurve(points=points) if points else None
 
@@ -111,20 +246,7 @@ class MetadataExtractor:
 
     def _extract_hsl_adjustments(self, data: dict, adjustments: LightroomAdjustments) -> None:
         """Extract HSL (Hue/Saturation/Luminance) adjustments."""
-        colors = ["Red", "Orange", "Yellow", "Green", "Aqua", "Blue", "Purple", "Magenta"]
-
-        for color in colors:
-            # Hue adjustments
-            hue_tag = f"XMP:HueAdjustment{color}"
-            if hue_tag in data:
-                adjustments.hue_adjustments[color.lower()] = data[hue_tag]
-
-            # Saturation adjustments
-            sat_tag = f"XMP:SaturationAdjustment{color}"
-            if sat_tag in data:
-                adjustments.saturation_adjustments[color.lower()] = data[sat_tag]
-
-            # Luminance adjustments
-            lum_tag = f"XMP:LuminanceAdjustment{color}"
-            if lum_tag in data:
-                adjustments.luminance_adjustments[color.lower()] = data[lum_tag]
+        for xmp_tag, color, attr_name in self.HSL_TAGS:
+            value = data.get(xmp_tag)
+            if value is not None:
+                getattr(adjustments, attr_name)[color] = value
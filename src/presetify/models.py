@@ -3,6 +3,24 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Tuple
 
+# Fields checked by LightroomAdjustments.has_adjustments()
+_BASIC_ATTRS = (
+    "exposure",
+    "contrast",
+    "highlights",
+    "shadows",
+    "whites",
+    "blacks",
+    "temperature",
+    "tint",
+    "vibrance",
+    "saturation",
+    "clarity",
+    "dehaze",
+    "texture",
+    "sharpness",
+)
+
 
 @dataclass
 class ToneCurve:
@@ -64,13 +82,10 @@ class LightroomAdjustments:
 
     def has_adjustments(self) -> bool:
         """Check if any adjustments were found."""
-        basic_adjustments = [
-            self.exposure, self.contrast, self.highlights, self.shadows,
-            self.whites, self.blacks, self.temperature, self.tint,
-            self.vibrance, self.saturation, self.clarity, self.dehaze,
-            self.texture, self.sharpness
-        ]
-        return any(adj is not None for adj in basic_adjustments) or bool(self.tone_curve)
+        if self.tone_curve is not None:
+            return True
+        values = self.__dict__
+        return any(values[attr] is not None for attr in _BASIC_ATTRS)
 
 
 @dataclass
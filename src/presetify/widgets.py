@@ -10,6 +10,54 @@ from textual.widgets import Static
 
 from .models import LightroomAdjustments, ToneCurve
 
+# Size of the tone curve plot in characters
+CURVE_WIDTH = 60
+CURVE_HEIGHT = 20
+
+# The plot is drawn into a flat bytearray, one row of CURVE_WIDTH cells plus a
+# newline per line, using ASCII placeholders that are mapped to box-drawing
+# characters once the finished grid is decoded
+_CURVE_STRIDE = CURVE_WIDTH + 1
+_CURVE_GLYPHS = (("|", "│"), ("-", "─"), ("+", "└"), ("*", "●"))
+_CURVE_POINT = ord("*")
+_CURVE_PLOTTABLE = b" -"  # Cells a curve point may overwrite
+
+# Slider bars are sliced from prebuilt strings instead of being multiplied out
+_BAR_WIDTH = 40
+_FULL_BAR = "█" * _BAR_WIDTH
+_EMPTY_BAR = "░" * _BAR_WIDTH
+
+# Sliders shown by AdjustmentsPanel: (label, attribute, min, max, unit)
+_BASIC_SPEC = (
+    ("Exposure", "exposure", -5.0, 5.0, ""),
+    ("Contrast", "contrast", -100, 100, ""),
+    ("Highlights", "highlights", -100, 100, ""),
+    ("Shadows", "shadows", -100, 100, ""),
+    ("Whites", "whites", -100, 100, ""),
+    ("Blacks", "blacks", -100, 100, ""),
+)
+_COLOR_SPEC = (
+    ("Temperature", "temperature", -10000, 10000, "K"),
+    ("Tint", "tint", -150, 150, ""),
+    ("Vibrance", "vibrance", -100, 100, ""),
+    ("Saturation", "saturation", -100, 100, ""),
+)
+_PRESENCE_SPEC = (
+    ("Clarity", "clarity", -100, 100, ""),
+    ("Dehaze", "dehaze", -100, 100, ""),
+    ("Texture", "texture", -100, 100, ""),
+)
+_SLIDER_SECTIONS = (
+    ("Basic Adjustments", _BASIC_SPEC),
+    ("Color Adjustments", _COLOR_SPEC),
+    ("Presence", _PRESENCE_SPEC),
+)
+
+# Rendered AdjustmentsPanel markup keyed by id() of the adjustments object.
+# Entries hold a reference to the object so its id can't be reused while cached.
+_PANEL_CACHE: dict[int, tuple[LightroomAdjustments, str]] = {}
+_PANEL_CACHE_SIZE = 128
+
 
 class AdjustmentSlider(Static):
     """Visual representation of a single Lightroom adjustment slider."""
@@ -42,38 +90,44 @@ class AdjustmentSlider(Static):
 
     def render(self) -> str:
         """Render the slider as text."""
-        if self.value is None:
-            return f"{self.label:20s} [dim]Not adjusted[/dim]"
-
-        # Calculate percentage position
-        range_val = self.max_val - self.min_val
-        normalized = (self.value - self.min_val) / range_val if range_val != 0 else 0.5
-        percentage = max(0, min(1, normalized))
-
-        # Create slider bar (40 characters wide)
-        bar_width = 40
-        filled = int(percentage * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
-
-        # Format value with proper sign and unit
-        if isinstance(self.value, float):
-            value_str = f"{self.value:+.2f}{self.unit}"
-        else:
-            value_str = f"{self.value:+d}{self.unit}"
-
-        # Color based on value
-        if self.value > 0:
-            color = "cyan"
-        elif self.value < 0:
-            color = "yellow"
-        else:
-            color = "white"
-
-        return (
-            f"{self.label:20s} {value_str:>10s}  "
-            f"[{color}]{bar}[/{color}]  "
-            f"[dim]({self.min_val:+.0f} to {self.max_val:+.0f})[/dim]"
-        )
+        return _render_slider(self.label, self.value, self.min_val, self.max_val, self.unit)
+
+
+def _render_slider(
+    label: str, value: float | int | None, min_val: float, max_val: float, unit: str = ""
+) -> str:
+    """Render one adjustment slider as a line of markup."""
+    if value is None:
+        return f"{label:20s} [dim]Not adjusted[/dim]"
+
+    # Calculate percentage position
+    range_val = max_val - min_val
+    normalized = (value - min_val) / range_val if range_val != 0 else 0.5
+    percentage = max(0, min(1, normalized))
+
+    # Create slider bar (_BAR_WIDTH characters wide)
+    filled = int(percentage * _BAR_WIDTH)
+    bar = _FULL_BAR[:filled] + _EMPTY_BAR[filled:]
+
+    # Format value with proper sign and unit
+    if isinstance(value, float):
+        value_str = f"{value:+.2f}{unit}"
+    else:
+        value_str = f"{value:+d}{unit}"
+
+    # Color based on value
+    if value > 0:
+        color = "cyan"
+    elif value < 0:
+        color = "yellow"
+    else:
+        color = "white"
+
+    return (
+        f"{label:20s} {value_str:>10s}  "
+        f"[{color}]{bar}[/{color}]  "
+        f"[dim]({min_val:+.0f} to {max_val:+.0f})[/dim]"
+    )
 
 
 class ToneCurveWidget(Static):
@@ -91,76 +145,81 @@ class ToneCurveWidget(Static):
 
     def render(self) -> str:
         """Render the tone curve as ASCII art."""
-        if not self.tone_curve or not self.tone_curve.points:
-            return "[dim]No tone curve adjustments[/dim]"
-
-        # Create ASCII art tone curve
-        width = 60
-        height = 20
-        points = self.tone_curve.points
-
-        # Initialize grid
-        grid = [[" " for _ in range(width)] for _ in range(height)]
-
-        # Draw axes
-        for y in range(height):
-            grid[y][0] = "│"
-        for x in range(width):
-            grid[height - 1][x] = "─"
-        grid[height - 1][0] = "└"
-
-        # Normalize and plot points
-        for i in range(len(points) - 1):
-            x1, y1 = points[i]
-            x2, y2 = points[i + 1]
-
-            # Normalize to grid coordinates
-            gx1 = int((x1 / 255) * (width - 2)) + 1
-            gy1 = height - 2 - int((y1 / 255) * (height - 2))
-            gx2 = int((x2 / 255) * (width - 2)) + 1
-            gy2 = height - 2 - int((y2 / 255) * (height - 2))
-
-            # Draw line between points using Bresenham's algorithm
-            self._draw_line(grid, gx1, gy1, gx2, gy2)
-
-        # Convert grid to string
-        lines = ["".join(row) for row in grid]
-        curve_str = "\n".join(lines)
-
-        return (
-            f"[bold cyan]Tone Curve[/bold cyan]\n"
-            f"[dim]Output[/dim]\n"
-            f"{curve_str}\n"
-            f"{' ' * (width - 10)}[dim]Input[/dim]"
-        )
-
-    def _draw_line(self, grid, x1, y1, x2, y2):
-        """Draw a line on the grid using Bresenham's algorithm."""
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        err = dx - dy
-
-        height = len(grid)
-        width = len(grid[0])
-
-        while True:
-            # Plot point if within bounds
-            if 0 <= y1 < height and 0 <= x1 < width:
-                if grid[y1][x1] == " " or grid[y1][x1] == "─":
-                    grid[y1][x1] = "●"
-
-            if x1 == x2 and y1 == y2:
-                break
-
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x1 += sx
-            if e2 < dx:
-                err += dx
-                y1 += sy
+        return _render_tone_curve(self.tone_curve)
+
+
+def _render_tone_curve(tone_curve: ToneCurve | None) -> str:
+    """Render a tone curve as ASCII art markup."""
+    if not tone_curve or not tone_curve.points:
+        return "[dim]No tone curve adjustments[/dim]"
+
+    # Create ASCII art tone curve
+    width = CURVE_WIDTH
+    height = CURVE_HEIGHT
+    points = tone_curve.points
+
+    # Initialize grid
+    grid = bytearray(b" " * width + b"\n") * height
+
+    # Draw axes
+    grid[::_CURVE_STRIDE] = b"|" * height
+    bottom = (height - 1) * _CURVE_STRIDE
+    grid[bottom : bottom + width] = b"-" * width
+    grid[bottom] = ord("+")
+
+    # Normalize and plot points
+    for i in range(len(points) - 1):
+        x1, y1 = points[i]
+        x2, y2 = points[i + 1]
+
+        # Normalize to grid coordinates
+        gx1 = int((x1 / 255) * (width - 2)) + 1
+        gy1 = height - 2 - int((y1 / 255) * (height - 2))
+        gx2 = int((x2 / 255) * (width - 2)) + 1
+        gy2 = height - 2 - int((y2 / 255) * (height - 2))
+
+        # Draw line between points using Bresenham's algorithm
+        _draw_line(grid, gx1, gy1, gx2, gy2)
+
+    # Convert grid to string, dropping the final newline. One str.replace
+    # per glyph runs in C, unlike str.translate with a non-ASCII table
+    curve_str = grid[:-1].decode("ascii")
+    for placeholder, glyph in _CURVE_GLYPHS:
+        curve_str = curve_str.replace(placeholder, glyph)
+
+    return (
+        f"[bold cyan]Tone Curve[/bold cyan]\n"
+        f"[dim]Output[/dim]\n"
+        f"{curve_str}\n"
+        f"{' ' * (width - 10)}[dim]Input[/dim]"
+    )
+
+
+def _draw_line(grid: bytearray, x1: int, y1: int, x2: int, y2: int) -> None:
+    """Draw a line on the grid buffer using Bresenham's algorithm."""
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx - dy
+
+    while True:
+        # Plot point if within bounds
+        if 0 <= y1 < CURVE_HEIGHT and 0 <= x1 < CURVE_WIDTH:
+            cell = y1 * _CURVE_STRIDE + x1
+            if grid[cell] in _CURVE_PLOTTABLE:
+                grid[cell] = _CURVE_POINT
+
+        if x1 == x2 and y1 == y2:
+            break
+
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x1 += sx
+        if e2 < dx:
+            err += dx
+            y1 += sy
 
 
 class AdjustmentsPanel(Static):
@@ -177,67 +236,41 @@ class AdjustmentsPanel(Static):
         self.adjustments = adjustments
 
     def render(self) -> str:
-        """Render all adjustments as sliders."""
+        """
+        Render all adjustments as sliders.
+
+        The markup is cached per adjustments object, which is treated as
+        immutable once extracted, so revisiting an image doesn't re-render it.
+        """
+        cached = _PANEL_CACHE.get(id(self.adjustments))
+        if cached is not None:
+            return cached[1]
+
+        rendered = self._render()
+        if len(_PANEL_CACHE) >= _PANEL_CACHE_SIZE:
+            # Evict the oldest entry
+            del _PANEL_CACHE[next(iter(_PANEL_CACHE))]
+        _PANEL_CACHE[id(self.adjustments)] = (self.adjustments, rendered)
+        return rendered
+
+    def _render(self) -> str:
+        """Build the panel markup."""
         if not self.adjustments.has_adjustments():
             return "[yellow]No Lightroom adjustments found in this image[/yellow]"
 
         sections = []
 
-        # Basic adjustments
-        basic = [
-            ("Exposure", self.adjustments.exposure, -5.0, 5.0, ""),
-            ("Contrast", self.adjustments.contrast, -100, 100, ""),
-            ("Highlights", self.adjustments.highlights, -100, 100, ""),
-            ("Shadows", self.adjustments.shadows, -100, 100, ""),
-            ("Whites", self.adjustments.whites, -100, 100, ""),
-            ("Blacks", self.adjustments.blacks, -100, 100, ""),
-        ]
-
-        basic_lines = ["[bold]Basic Adjustments[/bold]"]
-        for label, value, min_val, max_val, unit in basic:
-            if value is not None:
-                slider = AdjustmentSlider(label, value, min_val, max_val, unit)
-                basic_lines.append(slider.render())
-
-        if len(basic_lines) > 1:
-            sections.append("\n".join(basic_lines))
-
-        # Color adjustments
-        color = [
-            ("Temperature", self.adjustments.temperature, -10000, 10000, "K"),
-            ("Tint", self.adjustments.tint, -150, 150, ""),
-            ("Vibrance", self.adjustments.vibrance, -100, 100, ""),
-            ("Saturation", self.adjustments.saturation, -100, 100, ""),
-        ]
-
-        color_lines = ["[bold]Color Adjustments[/bold]"]
-        for label, value, min_val, max_val, unit in color:
-            if value is not None:
-                slider = AdjustmentSlider(label, value, min_val, max_val, unit)
-                color_lines.append(slider.render())
-
-        if len(color_lines) > 1:
-            sections.append("\n".join(color_lines))
-
-        # Presence
-        presence = [
-            ("Clarity", self.adjustments.clarity, -100, 100, ""),
-            ("Dehaze", self.adjustments.dehaze, -100, 100, ""),
-            ("Texture", self.adjustments.texture, -100, 100, ""),
-        ]
-
-        presence_lines = ["[bold]Presence[/bold]"]
-        for label, value, min_val, max_val, unit in presence:
-            if value is not None:
-                slider = AdjustmentSlider(label, value, min_val, max_val, unit)
-                presence_lines.append(slider.render())
-
-        if len(presence_lines) > 1:
-            sections.append("\n".join(presence_lines))
+        for title, spec in _SLIDER_SECTIONS:
+            lines = [
+                _render_slider(label, value, min_val, max_val, unit)
+                for label, attr, min_val, max_val, unit in spec
+                if (value := getattr(self.adjustments, attr)) is not None
+            ]
+            if lines:
+                sections.append(f"[bold]{title}[/bold]\n" + "\n".join(lines))
 
         # Tone curve
         if self.adjustments.tone_curve:
-            curve_widget = ToneCurveWidget(self.adjustments.tone_curve)
-            sections.append(curve_widget.render())
+            sections.append(_render_tone_curve(self.adjustments.tone_curve))
 
         return "\n\n".join(sections)
@@ -1,22 +1,189 @@
 """Generate Lightroom XMP preset files."""
 
+import functools
+import os
 import uuid
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from xml.etree import ElementTree as ET
-from xml.dom import minidom
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
 
-from .models import LightroomAdjustments, PresetMetadata
+if TYPE_CHECKING:
+    # Type checkers see the stdlib API, which lxml mirrors
+    from xml.etree import ElementTree as ET
+    from xml.etree.ElementTree import Element
+
+    HAVE_LXML: bool
+else:
+    # lxml is an optional, faster drop-in for the ElementTree API used here
+    try:
+        from lxml import etree as ET
+
+        HAVE_LXML = True
+    except ImportError:
+        from xml.etree import ElementTree as ET
+
+        HAVE_LXML = False
+
+from .models import LightroomAdjustments, PresetMetadata, ToneCurve
+
+# Batches smaller than this are written in-process; below it, starting worker
+# processes and pickling each preset costs more than generating it
+PARALLEL_BATCH_THRESHOLD = 1000
+
+# Presets sent to a worker process at a time
+_BATCH_CHUNK_SIZE = 64
+
+# XMP namespace URIs
+X_NS = "adobe:ns:meta/"
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+CRS_NS = "http://ns.adobe.com/camera-raw-settings/1.0/"
+
+# Clark-notation ("{uri}name") prefixes, so tag names are built once at import
+_X = "{" + X_NS + "}"
+_RDF = "{" + RDF_NS + "}"
+_CRS = "{" + CRS_NS + "}"
+_LI = _RDF + "li"
+
+# Fixed rdf:Description attribute values
+_XMPTK = "Adobe XMP Core 7.0-c000 1.000000"
+_CRS_VERSION = "16.5"  # Lightroom Classic version
+_PROCESS_VERSION = "11.0"
+
+# Document bytes around the Description attributes, for the string serializer
+_HEADER_BYTES = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    f'<x:xmpmeta xmlns:x="{X_NS}" xmlns:rdf="{RDF_NS}" xmlns:crs="{CRS_NS}"'
+    f' x:xmptk="{_XMPTK}">\n'
+    "  <rdf:RDF>\n"
+    f'    <rdf:Description rdf:about="" crs:Version="{_CRS_VERSION}"'
+    f' crs:ProcessVersion="{_PROCESS_VERSION}"'
+).encode("utf-8")
+_FOOTER_BYTES = b"/>\n  </rdf:RDF>\n</x:xmpmeta>\n"
+_EMPTY_PRESET_BYTES = _HEADER_BYTES + _FOOTER_BYTES
+_QUOTE_ENTITIES = {'"': "&quot;"}
+_NUMBER_TYPES = frozenset({int, float})
+
+# HSL colors as (LightroomAdjustments dict key, XMP tag suffix)
+_HSL_COLORS = (
+    ("red", "Red"),
+    ("orange", "Orange"),
+    ("yellow", "Yellow"),
+    ("green", "Green"),
+    ("aqua", "Aqua"),
+    ("blue", "Blue"),
+    ("purple", "Purple"),
+    ("magenta", "Magenta"),
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _fmt_float(value: float) -> str:
+    """
+    Format a float adjustment with an explicit sign and two decimals.
+
+    Slider values come from a small set, so results are cached. Adding 0.0
+    turns -0.0 into 0.0; the two share a cache entry and must format alike.
+    """
+    return f"{value + 0.0:+.2f}"
+
+
+def _escape_text(value: object) -> str:
+    """Format a non-numeric value as text for a double-quoted XML attribute."""
+    return escape(str(value), _QUOTE_ENTITIES)
+
+
+def _exposure_formatter(fallback: Callable[[object], str]) -> Callable[[object], str]:
+    """Build an exposure formatter; numbers are always signed with two decimals."""
+
+    def fmt_exposure(value: object) -> str:
+        if type(value) in _NUMBER_TYPES:
+            return _fmt_float(value)
+        return fallback(value)
+
+    return fmt_exposure
+
+
+def _slider_formatter(fallback: Callable[[object], str]) -> Callable[[object], str]:
+    """Build an integer slider formatter; floats keep the signed two-decimal form."""
+
+    def fmt_slider(value: object) -> str:
+        value_type = type(value)
+        if value_type is int:
+            return str(value)
+        if value_type is float:
+            return _fmt_float(value)
+        return fallback(value)
+
+    return fmt_slider
+
+
+# Formatters for the ElementTree path, which escapes attribute values itself
+_fmt_exposure = _exposure_formatter(str)
+_fmt_slider = _slider_formatter(str)
+
+# The same formatters for the string serializer, escaping non-numeric values
+_QUOTED_FORMATTERS = {
+    _fmt_exposure: _exposure_formatter(_escape_text),
+    _fmt_slider: _slider_formatter(_escape_text),
+}
+
+
+def _quote_hsl(value: object) -> str:
+    """Format an HSL value for the string serializer, escaping non-integers."""
+    if type(value) is int:
+        return str(value)
+    return _escape_text(value)
 
 
 class XMPGenerator:
     """Generate Lightroom Classic XMP preset files."""
 
     # XMP namespaces
-    NAMESPACES = {
-        "x": "adobe:ns:meta/",
-        "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-        "crs": "http://ns.adobe.com/camera-raw-settings/1.0/",
-    }
+    NAMESPACES = {"x": X_NS, "rdf": RDF_NS, "crs": CRS_NS}
+
+    # Model attribute -> (XMP attribute, formatter) for the scalar adjustments
+    _ADJ_MAP = (
+        ("exposure", _CRS + "Exposure2012", _fmt_exposure),
+        ("contrast", _CRS + "Contrast2012", _fmt_slider),
+        ("highlights", _CRS + "Highlights2012", _fmt_slider),
+        ("shadows", _CRS + "Shadows2012", _fmt_slider),
+        ("whites", _CRS + "Whites2012", _fmt_slider),
+        ("blacks", _CRS + "Blacks2012", _fmt_slider),
+        ("temperature", _CRS + "Temperature", _fmt_slider),
+        ("tint", _CRS + "Tint", _fmt_slider),
+        ("vibrance", _CRS + "Vibrance", _fmt_slider),
+        ("saturation", _CRS + "Saturation", _fmt_slider),
+        ("clarity", _CRS + "Clarity2012", _fmt_slider),
+        ("dehaze", _CRS + "Dehaze", _fmt_slider),
+        ("texture", _CRS + "Texture", _fmt_slider),
+        ("sharpness", _CRS + "Sharpness", _fmt_slider),
+        ("luminance_noise_reduction", _CRS + "LuminanceSmoothing", _fmt_slider),
+        ("color_noise_reduction", _CRS + "ColorNoiseReduction", _fmt_slider),
+        ("vignette_amount", _CRS + "PostCropVignetteAmount", _fmt_slider),
+        ("grain_amount", _CRS + "GrainAmount", _fmt_slider),
+    )
+
+    # HSL dict attribute -> {color key: XMP attribute}
+    _HSL_MAP = tuple(
+        (attr_name, {color: _CRS + kind + "Adjustment" + suffix for color, suffix in _HSL_COLORS})
+        for attr_name, kind in (
+            ("hue_adjustments", "Hue"),
+            ("saturation_adjustments", "Saturation"),
+            ("luminance_adjustments", "Luminance"),
+        )
+    )
+
+    # The same tables as ' crs:Name="' fragments, for the string serializer
+    _ADJ_FRAGMENTS = tuple(
+        (attr_name, f' crs:{xmp_tag[len(_CRS):]}="', _QUOTED_FORMATTERS[fmt])
+        for attr_name, xmp_tag, fmt in _ADJ_MAP
+    )
+    _HSL_FRAGMENTS = tuple(
+        (attr_name, {color: f' crs:{tag[len(_CRS):]}="' for color, tag in xmp_tags.items()})
+        for attr_name, xmp_tags in _HSL_MAP
+    )
 
     def generate(
         self,
@@ -34,41 +201,130 @@ class XMPGenerator:
         """
         output_path = Path(output_path)
 
+        # A preset with nothing set is a fixed document
+        if self._is_empty(adjustments):
+            output_path.write_bytes(_EMPTY_PRESET_BYTES)
+            return
+
+        # Most presets have no tone curve and take the specialized path
+        if adjustments.tone_curve is None or not adjustments.tone_curve.points:
+            self._generate_simple(adjustments, metadata, output_path)
+            return
+
         # Build XMP structure
         xmp_doc = self._build_xmp_structure(adjustments, metadata)
 
-        # Write to file with proper formatting
-        xml_string = self._prettify_xml(xmp_doc)
-        output_path.write_text(xml_string, encoding="utf-8")
+        # Stream the indented document straight to the file
+        tree = ET.ElementTree(xmp_doc)
+        if HAVE_LXML:
+            # pretty_print is lxml-only, so the stdlib stubs do not declare it
+            tree.write(
+                str(output_path),
+                pretty_print=True,  # type: ignore[call-arg]
+                xml_declaration=True,
+                encoding="UTF-8",
+            )
+        else:
+            ET.indent(tree, space="  ")
+            tree.write(output_path, encoding="utf-8", xml_declaration=True)
+
+    def generate_many(
+        self,
+        items: Iterable[tuple[LightroomAdjustments, PresetMetadata, str | Path]],
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Generate many XMP preset files, in parallel for large batches.
+
+        This is the recommended entry point for bulk exports. Presets are
+        independent CPU-bound work, so large batches are spread over a process
+        pool; smaller ones, or any batch on a single CPU, are generated
+        in-process.
+
+        Args:
+            items: (adjustments, metadata, output_path) tuples, one per preset
+            max_workers: Number of worker processes (defaults to the CPU count)
+        """
+        items = list(items)
+        workers = max_workers or os.cpu_count() or 1
+        if workers < 2 or len(items) < PARALLEL_BATCH_THRESHOLD:
+            for adjustments, metadata, output_path in items:
+                self.generate(adjustments, metadata, output_path)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Drain the results so a failed preset raises here
+            for _ in executor.map(_generate_one, items, chunksize=_BATCH_CHUNK_SIZE):
+                pass
+
+    def _is_empty(self, adjustments: LightroomAdjustments) -> bool:
+        """Check that none of the adjustments written to a preset are set."""
+        # has_adjustments() is not enough: it ignores HSL, noise reduction and effects
+        values = adjustments.__dict__
+        tone_curve = values["tone_curve"]
+        return (
+            (tone_curve is None or not tone_curve.points)
+            and all(values[attr_name] is None for attr_name, _, _ in self._ADJ_MAP)
+            and not any(values[attr_name] for attr_name, _ in self._HSL_MAP)
+        )
+
+    def _generate_simple(
+        self, adjustments: LightroomAdjustments, metadata: PresetMetadata, output_path: Path
+    ) -> None:
+        """Write a preset without a tone curve, skipping the ElementTree path."""
+        output_path.write_bytes(self._serialize_fast(adjustments, metadata))
+
+    def _serialize_fast(self, adjustments: LightroomAdjustments, metadata: PresetMetadata) -> bytes:
+        """Serialize a preset without a tone curve directly to XMP bytes."""
+        parts: list[str] = []
+
+        # Field values straight from the instance dict, avoiding a getattr per field
+        values = adjustments.__dict__
+
+        # Only set values contribute a fragment
+        for attr_name, fragment, fmt in self._ADJ_FRAGMENTS:
+            value = values[attr_name]
+            if value is not None:
+                parts.append(f'{fragment}{fmt(value)}"')
+
+        for attr_name, fragments in self._HSL_FRAGMENTS:
+            for color, value in values[attr_name].items():
+                color_fragment = fragments.get(color)
+                if color_fragment is not None:
+                    parts.append(f'{color_fragment}{_quote_hsl(value)}"')
+
+        # Only the attributes are encoded per call
+        return _HEADER_BYTES + "".join(parts).encode("utf-8") + _FOOTER_BYTES
 
     def _build_xmp_structure(
         self, adjustments: LightroomAdjustments, metadata: PresetMetadata
-    ) -> ET.Element:
+    ) -> "Element":
         """Build the XMP XML structure."""
-        # Register namespaces
-        for prefix, uri in self.NAMESPACES.items():
-            ET.register_namespace(prefix, uri)
-
-        # Root element
-        root = ET.Element(
-            f"{{{self.NAMESPACES['x']}}}xmpmeta",
-            attrib={f"{{{self.NAMESPACES['x']}}}xmptk": "Adobe XMP Core 7.0-c000 1.000000"},
-        )
+        root_attribs = {_X + "xmptk": _XMPTK}
+
+        # Root element, declaring the namespace prefixes
+        if HAVE_LXML:
+            # nsmap is lxml-only, so the stdlib stubs do not declare it
+            root = ET.Element(
+                _X + "xmpmeta", attrib=root_attribs, nsmap=self.NAMESPACES  # type: ignore[arg-type]
+            )
+        else:
+            root = ET.Element(_X + "xmpmeta", attrib=root_attribs)
 
         # RDF element
-        rdf = ET.SubElement(root, f"{{{self.NAMESPACES['rdf']}}}RDF")
+        rdf = ET.SubElement(root, _RDF + "RDF")
 
         # Description element with all adjustments
         desc_attribs = {
-            f"{{{self.NAMESPACES['rdf']}}}about": "",
-            f"{{{self.NAMESPACES['crs']}}}Version": "16.5",  # Lightroom Classic version
-            f"{{{self.NAMESPACES['crs']}}}ProcessVersion": "11.0",
+            _RDF + "about": "",
+            _CRS + "Version": _CRS_VERSION,
+            _CRS + "ProcessVersion": _PROCESS_VERSION,
         }
 
         # Add adjustment attributes
         self._add_adjustments_to_attribs(adjustments, desc_attribs)
 
-        desc = ET.SubElement(rdf, f"{{{self.NAMESPACES['rdf']}}}Description", attrib=desc_attribs)
+        desc = ET.SubElement(rdf, _RDF + "Description", attrib=desc_attribs)
 
         # Add tone curve as nested element if present
         if adjustments.tone_curve and adjustments.tone_curve.points:
@@ -77,93 +333,49 @@ class XMPGenerator:
         return root
 
     def _add_adjustments_to_attribs(
-        self, adjustments: LightroomAdjustments, attribs: dict
+        self, adjustments: LightroomAdjustments, attribs: dict[str, str]
     ) -> None:
         """Add adjustment values as XML attributes."""
-        crs = self.NAMESPACES["crs"]
-
-        # Map model attributes to XMP tags
-        mappings = {
-            "exposure": (f"{{{crs}}}Exposure2012", adjustments.exposure),
-            "contrast": (f"{{{crs}}}Contrast2012", adjustments.contrast),
-            "highlights": (f"{{{crs}}}Highlights2012", adjustments.highlights),
-            "shadows": (f"{{{crs}}}Shadows2012", adjustments.shadows),
-            "whites": (f"{{{crs}}}Whites2012", adjustments.whites),
-            "blacks": (f"{{{crs}}}Blacks2012", adjustments.blacks),
-            "temperature": (f"{{{crs}}}Temperature", adjustments.temperature),
-            "tint": (f"{{{crs}}}Tint", adjustments.tint),
-            "vibrance": (f"{{{crs}}}Vibrance", adjustments.vibrance),
-            "saturation": (f"{{{crs}}}Saturation", adjustments.saturation),
-            "clarity": (f"{{{crs}}}Clarity2012", adjustments.clarity),
-            "dehaze": (f"{{{crs}}}Dehaze", adjustments.dehaze),
-            "texture": (f"{{{crs}}}Texture", adjustments.texture),
-            "sharpness": (f"{{{crs}}}Sharpness", adjustments.sharpness),
-            "luminance_noise_reduction": (
-                f"{{{crs}}}LuminanceSmoothing",
-                adjustments.luminance_noise_reduction,
-            ),
-            "color_noise_reduction": (
-                f"{{{crs}}}ColorNoiseReduction",
-                adjustments.color_noise_reduction,
-            ),
-            "vignette_amount": (
-                f"{{{crs}}}PostCropVignetteAmount",
-                adjustments.vignette_amount,
-            ),
-            "grain_amount": (f"{{{crs}}}GrainAmount", adjustments.grain_amount),
-        }
-
         # Add non-null values
-        for key, (xmp_tag, value) in mappings.items():
+        values = adjustments.__dict__
+        for attr_name, xmp_tag, fmt in self._ADJ_MAP:
+            value = values[attr_name]
             if value is not None:
-                # Format float values properly
-                if isinstance(value, float):
-                    attribs[xmp_tag] = f"{value:+.2f}" if value >= 0 else f"{value:.2f}"
-                else:
-                    attribs[xmp_tag] = str(value)
+                attribs[xmp_tag] = fmt(value)
 
         # Add HSL adjustments
         self._add_hsl_adjustments(attribs, adjustments)
 
-    def _add_hsl_adjustments(self, attribs: dict, adjustments: LightroomAdjustments) -> None:
+    def _add_hsl_adjustments(
+        self, attribs: dict[str, str], adjustments: LightroomAdjustments
+    ) -> None:
         """Add HSL adjustments to attributes."""
-        crs = self.NAMESPACES["crs"]
-        colors = ["Red", "Orange", "Yellow", "Green", "Aqua", "Blue", "Purple", "Magenta"]
-
-        for color in colors:
-            color_lower = color.lower()
+        # Only colors that are actually set are visited
+        values = adjustments.__dict__
+        for attr_name, xmp_tags in self._HSL_MAP:
+            for color, value in values[attr_name].items():
+                xmp_tag = xmp_tags.get(color)
+                if xmp_tag is not None:
+                    attribs[xmp_tag] = str(value)
 
-            if color_lower in adjustments.hue_adjustments:
-                attribs[f"{{{crs}}}HueAdjustment{color}"] = str(
-                    adjustments.hue_adjustments[color_lower]
-                )
+    def _add_tone_curve_element(self, parent: "Element", tone_curve: ToneCurve) -> None:
+        """Add tone curve as a nested RDF Seq element."""
+        # Create ToneCurvePV2012 element
+        curve_elem = ET.SubElement(parent, _CRS + "ToneCurvePV2012")
+        seq = ET.SubElement(curve_elem, _RDF + "Seq")
 
-            if color_lower in adjustments.saturation_adjustments:
-                attribs[f"{{{crs}}}SaturationAdjustment{color}"] = str(
-                    adjustments.saturation_adjustments[color_lower]
-                )
+        # XMP needs one li element per point, so bind the factory once for the loop
+        sub_element = ET.SubElement
+        for x, y in tone_curve.points:
+            sub_element(seq, _LI).text = f"{x}, {y}"
 
-            if color_lower in adjustments.luminance_adjustments:
-                attribs[f"{{{crs}}}LuminanceAdjustment{color}"] = str(
-                    adjustments.luminance_adjustments[color_lower]
-                )
 
-    def _add_tone_curve_element(self, parent: ET.Element, tone_curve) -> None:
-        """Add tone curve as a nested RDF Seq element."""
-        crs = self.NAMESPACES["crs"]
-        rdf = self.NAMESPACES["rdf"]
+def _generate_one(item: tuple[LightroomAdjustments, PresetMetadata, str | Path]) -> None:
+    """Generate one preset in a generate_many worker process."""
+    XMPGenerator().generate(*item)
 
-        # Create ToneCurvePV2012 element
-        curve_elem = ET.SubElement(parent, f"{{{crs}}}ToneCurvePV2012")
-        seq = ET.SubElement(curve_elem, f"{{{rdf}}}Seq")
 
-        # Add each point as an li element
-        for x, y in tone_curve.points:
-            li = ET.SubElement(seq, f"{{{rdf}}}li")
-            li.text = f"{x}, {y}"
-
-    def _prettify_xml(self, elem: ET.Element) -> str:
-        """Format XML with proper indentation."""
-        rough_string = ET.tostring(elem, encoding="unicode")
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ", encoding="UTF-8").decode("utf-8")
+# ElementTree keeps prefixes in a global registry, so register them once at import
+if not HAVE_LXML:
+    for _prefix, _uri in XMPGenerator.NAMESPACES.items():
+        ET.register_namespace(_prefix, _uri)
@@ -0,0 +1,33 @@
+"""Tests for command-line argument handling."""
+
+import sys
+
+from presetify.cli import parse_arguments
+
+
+def test_parse_arguments_expands_globs(tmp_path, monkeypatch):
+    """Test glob patterns are expanded against the files in their directory."""
+    for name in ("a.jpg", "b.jpg", "notes.txt"):
+        (tmp_path / name).touch()
+    (tmp_path / "sub.jpg").mkdir()
+
+    monkeypatch.setattr(
+        sys, "argv", ["presetify", str(tmp_path / "*.jpg"), str(tmp_path / "notes.*")]
+    )
+    image_paths, urls = parse_arguments()
+
+    assert sorted(p.name for p in image_paths[:2]) == ["a.jpg", "b.jpg"]
+    assert image_paths[2:] == [tmp_path / "notes.txt"]
+    assert urls == []
+
+
+def test_parse_arguments_splits_urls(tmp_path, monkeypatch):
+    """Test URLs are separated from local files."""
+    image = tmp_path / "image.jpg"
+    image.touch()
+
+    monkeypatch.setattr(sys, "argv", ["presetify", str(image), "https://example.com/a.jpg"])
+    image_paths, urls = parse_arguments()
+
+    assert image_paths == [image]
+    assert urls == ["https://example.com/a.jpg"]
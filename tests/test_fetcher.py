@@ -0,0 +1,90 @@
+"""Tests for downloading images from URLs."""
+
+import asyncio
+import tempfile
+
+import httpx
+import pytest
+from presetify import fetcher
+from presetify.fetcher import ImageFetcher
+
+
+class StalledBody(httpx.AsyncByteStream):
+    """Response body that sends one chunk, then waits until the request is cancelled."""
+
+    async def __aiter__(self):
+        yield b"partial"
+        await asyncio.Event().wait()
+
+
+def _handler(request):
+    """Serve JPEGs, a 404 for paths containing "missing" and a stalled body for "stall"."""
+    if "missing" in request.url.path:
+        return httpx.Response(404)
+    if "stall" in request.url.path:
+        return httpx.Response(200, headers={"content-type": "image/jpeg"}, stream=StalledBody())
+    return httpx.Response(200, headers={"content-type": "image/jpeg"}, content=b"jpeg data")
+
+
+@pytest.fixture
+def temp_dir(tmp_path, monkeypatch):
+    """Serve requests from _handler and keep temporary downloads in tmp_path."""
+    client_class = httpx.AsyncClient
+
+    def mock_client(*args, **kwargs):
+        return client_class(*args, transport=httpx.MockTransport(_handler), **kwargs)
+
+    monkeypatch.setattr(fetcher.httpx, "AsyncClient", mock_client)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+
+def test_fetch_cancelled_removes_partial_file(temp_dir):
+    """Test a download cancelled mid-stream leaves no temporary file behind."""
+
+    async def cancel_fetch():
+        async with ImageFetcher() as image_fetcher:
+            task = asyncio.create_task(image_fetcher.fetch("https://example.com/stall.jpg"))
+            while not list(temp_dir.iterdir()):
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(cancel_fetch())
+    assert list(temp_dir.iterdir()) == []
+
+
+def test_fetch_as_completed_yields_each_url_once(temp_dir):
+    """Test every URL is yielded exactly once, with None for a failed download."""
+    urls = [f"https://example.com/{name}.jpg" for name in ("a", "b", "missing", "c", "d")]
+
+    async def fetch_all():
+        async with ImageFetcher() as image_fetcher:
+            return [result async for result in image_fetcher.fetch_as_completed(urls, workers=2)]
+
+    results = dict(asyncio.run(fetch_all()))
+
+    assert sorted(results) == sorted(urls)
+    assert results.pop("https://example.com/missing.jpg") is None
+    assert sorted(temp_dir.iterdir()) == sorted(results.values())
+    assert all(path.read_bytes() == b"jpeg data" for path in results.values())
+
+
+def test_fetch_as_completed_closed_early_leaves_no_files(temp_dir):
+    """Test closing the stream early removes partial and unclaimed downloads."""
+    urls = [f"https://example.com/{name}.jpg" for name in ("a", "b", "stall")]
+
+    async def take_first():
+        async with ImageFetcher() as image_fetcher:
+            results = image_fetcher.fetch_as_completed(urls, workers=3)
+            _, path = await anext(results)
+            # Wait until the other download is complete and the stalled one started
+            while [p.read_bytes() for p in temp_dir.iterdir()].count(b"jpeg data") < 2:
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.01)
+            await results.aclose()
+            # Checked before asyncio.run() cancels any leftover tasks
+            assert list(temp_dir.iterdir()) == [path]
+
+    asyncio.run(take_first())
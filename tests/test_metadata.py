@@ -0,0 +1,173 @@
+"""Tests for metadata extraction."""
+
+import os
+import threading
+import time
+
+import exiftool
+import pytest
+from presetify import metadata
+from presetify.metadata import MetadataExtractor
+from presetify.models import LightroomAdjustments
+
+
+class StubExifToolHelper:
+    """Stand-in for exiftool.ExifToolHelper that records its get_tags calls."""
+
+    calls: list[list[str]] = []
+    # When set, batch calls (more than one file) block until the event is set
+    batch_gate: threading.Event | None = None
+    # Contrast value returned per file, 10 for files not listed
+    contrast: dict[str, int] = {}
+    # Calls including this file raise, like a batch ExifTool fails on
+    failing_file: str | None = None
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def run(self):
+        pass
+
+    def terminate(self):
+        pass
+
+    def get_tags(self, files, tags):
+        files = [files] if isinstance(files, str) else list(files)
+        self.calls.append(files)
+        if len(files) > 1 and self.batch_gate is not None:
+            self.batch_gate.wait(5)
+        if self.failing_file in files:
+            raise RuntimeError("ExifTool failed")
+        # Results are matched by SourceFile, not by position
+        return [
+            {"SourceFile": f, "XMP:Contrast2012": self.contrast.get(f, 10)} for f in reversed(files)
+        ]
+
+
+@pytest.fixture
+def exiftool_calls(monkeypatch):
+    """Replace ExifTool with a stub and return the list of files per get_tags call."""
+    monkeypatch.setattr(exiftool, "ExifToolHelper", StubExifToolHelper)
+    monkeypatch.setattr(StubExifToolHelper, "calls", [])
+    monkeypatch.setattr(StubExifToolHelper, "batch_gate", None)
+    monkeypatch.setattr(StubExifToolHelper, "contrast", {})
+    monkeypatch.setattr(StubExifToolHelper, "failing_file", None)
+    return StubExifToolHelper.calls
+
+
+def _images(tmp_path, count):
+    """Create empty image files and return their paths as strings."""
+    paths = [tmp_path / f"img{i}.jpg" for i in range(count)]
+    for path in paths:
+        path.touch()
+    return [str(path) for path in paths]
+
+
+def test_parse_tone_curve_string():
+    """Test parsing a tone curve stored as a flat comma-separated string."""
+    curve = MetadataExtractor()._parse_tone_curve("0, 0, 64, 56, 255, 255")
+    assert curve.points == [(0, 0), (64, 56), (255, 255)]
+
+
+def test_parse_tone_curve_point_list():
+    """Test parsing a tone curve returned by ExifTool as one string per point."""
+    curve = MetadataExtractor()._parse_tone_curve(["0, 0", "128, 140", "255, 255"])
+    assert curve.points == [(0, 0), (128, 140), (255, 255)]
+
+
+def test_parse_tone_curve_invalid():
+    """Test invalid tone curve data is ignored."""
+    extractor = MetadataExtractor()
+    assert extractor._parse_tone_curve("") is None
+    assert extractor._parse_tone_curve("0, 0, abc, 255") is None
+    assert extractor._parse_tone_curve("7") is None
+
+
+def test_extract_hsl_adjustments():
+    """Test HSL tags are collected per color."""
+    adjustments = LightroomAdjustments()
+    MetadataExtractor()._extract_hsl_adjustments(
+        {
+            "XMP:HueAdjustmentRed": 10,
+            "XMP:SaturationAdjustmentBlue": -5,
+            "XMP:LuminanceAdjustmentOrange": 0,
+        },
+        adjustments,
+    )
+    assert adjustments.hue_adjustments == {"red": 10}
+    assert adjustments.saturation_adjustments == {"blue": -5}
+    assert adjustments.luminance_adjustments == {"orange": 0}
+
+
+def test_prefetch_reads_in_batches(tmp_path, monkeypatch, exiftool_calls):
+    """Test prefetch() makes one ExifTool call per batch and serves extract() from it."""
+    monkeypatch.setattr(metadata, "PREFETCH_BATCH_SIZE", 2)
+    images = _images(tmp_path, 5)
+    StubExifToolHelper.contrast = {image: i for i, image in enumerate(images)}
+    extractor = MetadataExtractor()
+
+    extractor.prefetch(images)
+    assert exiftool_calls == [images[0:2], images[2:4], images[4:5]]
+
+    assert [extractor.extract(image).contrast for image in images] == [0, 1, 2, 3, 4]
+    assert len(exiftool_calls) == 3
+
+
+def test_prefetch_skips_failed_batch(tmp_path, monkeypatch, exiftool_calls):
+    """Test a failed batch is left for extract() while other batches are cached."""
+    monkeypatch.setattr(metadata, "PREFETCH_BATCH_SIZE", 2)
+    images = _images(tmp_path, 4)
+    StubExifToolHelper.failing_file = images[0]
+    extractor = MetadataExtractor()
+
+    extractor.prefetch(images)
+    assert exiftool_calls == [images[0:2], images[2:4]]
+
+    StubExifToolHelper.failing_file = None
+    assert extractor.extract(images[1]).contrast == 10
+    assert extractor.extract(images[3]).contrast == 10
+    assert exiftool_calls[2:] == [[images[1]]]
+
+
+def test_extract_memoizes_by_mtime(tmp_path, exiftool_calls):
+    """Test revisiting an unchanged file doesn't call ExifTool, but an edited one does."""
+    (image,) = _images(tmp_path, 1)
+    extractor = MetadataExtractor()
+
+    first = extractor.extract(image)
+    assert extractor.extract(image) is first
+    assert exiftool_calls == [[image]]
+
+    mtime_ns = os.stat(image).st_mtime_ns + 1_000_000_000
+    os.utime(image, ns=(mtime_ns, mtime_ns))
+    StubExifToolHelper.contrast = {image: 42}
+
+    assert extractor.extract(image).contrast == 42
+    assert exiftool_calls == [[image], [image]]
+
+
+def test_extract_goes_ahead_of_queued_prefetch_batches(tmp_path, exiftool_calls):
+    """Test a waiting extract() runs before the next prefetch batch."""
+    images = _images(tmp_path, 5)
+    gate = threading.Event()
+    StubExifToolHelper.batch_gate = gate
+    extractor = MetadataExtractor()
+
+    def prefetch_in_batches():
+        for batch in (images[:2], images[2:4]):
+            extractor.prefetch(batch)
+
+    prefetcher = threading.Thread(target=prefetch_in_batches)
+    prefetcher.start()
+    while not exiftool_calls:
+        time.sleep(0.001)
+
+    interactive = threading.Thread(target=extractor.extract, args=(images[4],))
+    interactive.start()
+    while not extractor._waiting:
+        time.sleep(0.001)
+    gate.set()
+    prefetcher.join(5)
+    interactive.join(5)
+
+    assert exiftool_calls == [images[:2], [images[4]], images[2:4]]
@@ -32,6 +32,14 @@ def test_adjustments_has_adjustments_false():
     assert adj.has_adjustments() is False
 
 
+def test_adjustments_has_adjustments_ignores_other_fields():
+    """Test has_adjustments only considers basic adjustments and the tone curve."""
+    adj = LightroomAdjustments(grain_amount=25, hue_adjustments={"red": 10}, source_file="a.jpg")
+    assert adj.has_adjustments() is False
+    adj.sharpness = 40
+    assert adj.has_adjustments() is True
+
+
 def test_adjustments_with_tone_curve():
     """Test adjustments with tone curve."""
     curve = ToneCurve(points=[(0, 0), (255, 255)])
@@ -0,0 +1,33 @@
+"""Tests for TUI widgets."""
+
+from presetify.models import ToneCurve
+from presetify.widgets import CURVE_HEIGHT, CURVE_WIDTH, ToneCurveWidget
+
+
+def _curve_rows(tone_curve):
+    """Render a tone curve and return only the grid rows."""
+    rendered = ToneCurveWidget(tone_curve).render()
+    return rendered.split("\n")[2 : 2 + CURVE_HEIGHT]
+
+
+def test_tone_curve_without_points():
+    """Test rendering an empty tone curve."""
+    assert ToneCurveWidget(ToneCurve()).render() == "[dim]No tone curve adjustments[/dim]"
+    assert ToneCurveWidget(None).render() == "[dim]No tone curve adjustments[/dim]"
+
+
+def test_tone_curve_grid_axes():
+    """Test the grid dimensions and axes of the tone curve plot."""
+    rows = _curve_rows(ToneCurve(points=[(0, 0), (255, 255)]))
+    assert len(rows) == CURVE_HEIGHT
+    assert all(len(row) == CURVE_WIDTH for row in rows)
+    assert all(row[0] == "│" for row in rows[:-1])
+    assert rows[-1] == "└" + "─" * (CURVE_WIDTH - 1)
+
+
+def test_tone_curve_linear_plot():
+    """Test a linear curve is drawn from bottom left to top right."""
+    rows = _curve_rows(ToneCurve(points=[(0, 0), (255, 255)]))
+    assert rows[CURVE_HEIGHT - 2][1] == "●"
+    assert rows[0][CURVE_WIDTH - 1] == "●"
+    assert sum(row.count("●") for row in rows) == CURVE_WIDTH - 1
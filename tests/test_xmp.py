@@ -0,0 +1,155 @@
+"""Tests for XMP preset generation."""
+
+from xml.etree import ElementTree as ET
+
+import pytest
+from presetify import xmp
+from presetify.models import LightroomAdjustments, PresetMetadata, ToneCurve
+from presetify.xmp import XMPGenerator
+
+CRS = "{http://ns.adobe.com/camera-raw-settings/1.0/}"
+RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+
+
+@pytest.fixture
+def generate(tmp_path):
+    """Generate a preset and return the path of the written file."""
+
+    def _generate(adjustments):
+        output_path = tmp_path / "preset.xmp"
+        XMPGenerator().generate(adjustments, PresetMetadata(name="Test"), output_path)
+        return output_path
+
+    return _generate
+
+
+def _description(path):
+    """Parse a generated preset and return its rdf:Description element."""
+    root = ET.parse(path).getroot()
+    assert root.tag == "{adobe:ns:meta/}xmpmeta"
+    return root.find(f"{RDF}RDF/{RDF}Description")
+
+
+def test_generate_basic_adjustments(generate):
+    """Test adjustment values are written as formatted crs attributes."""
+    path = generate(LightroomAdjustments(exposure=1.5, contrast=20, highlights=-30))
+    desc = _description(path)
+
+    assert path.read_text(encoding="utf-8").startswith("<?xml")
+    assert desc.get(f"{CRS}Version") == "16.5"
+    assert desc.get(f"{CRS}ProcessVersion") == "11.0"
+    assert desc.get(f"{CRS}Exposure2012") == "+1.50"
+    assert desc.get(f"{CRS}Contrast2012") == "20"
+    assert desc.get(f"{CRS}Highlights2012") == "-30"
+    assert desc.get(f"{CRS}Shadows2012") is None
+
+
+def test_generate_negative_float(generate):
+    """Test negative float values keep their sign and two decimals."""
+    desc = _description(generate(LightroomAdjustments(exposure=-0.25)))
+    assert desc.get(f"{CRS}Exposure2012") == "-0.25"
+
+
+def test_generate_integer_exposure(generate):
+    """Test exposure is formatted as a float even when read back as an int."""
+    desc = _description(generate(LightroomAdjustments(exposure=1)))
+    assert desc.get(f"{CRS}Exposure2012") == "+1.00"
+
+
+def test_generate_float_in_integer_slider(generate):
+    """Test a float read into an integer slider keeps the signed two-decimal form."""
+    desc = _description(generate(LightroomAdjustments(contrast=25.0)))
+    assert desc.get(f"{CRS}Contrast2012") == "+25.00"
+
+
+@pytest.mark.parametrize("tone_curve", [None, ToneCurve(points=[(0, 0), (255, 255)])])
+def test_generate_escapes_attribute_values(generate, tone_curve):
+    """Test non-numeric values are escaped on both generate paths."""
+    adjustments = LightroomAdjustments(
+        contrast='a"b&c', hue_adjustments={"red": "<1>"}, tone_curve=tone_curve
+    )
+    desc = _description(generate(adjustments))
+    assert desc.get(f"{CRS}Contrast2012") == 'a"b&c'
+    assert desc.get(f"{CRS}HueAdjustmentRed") == "<1>"
+
+
+def test_generate_empty_preset(generate):
+    """Test a preset with no adjustments only carries the fixed attributes."""
+    desc = _description(generate(LightroomAdjustments(tone_curve=ToneCurve())))
+    assert sorted(desc.attrib) == sorted([f"{RDF}about", f"{CRS}Version", f"{CRS}ProcessVersion"])
+
+
+def test_generate_adjustments_outside_has_adjustments(generate):
+    """Test values has_adjustments() ignores are still written."""
+    adjustments = LightroomAdjustments(grain_amount=10, hue_adjustments={"aqua": -3})
+    assert not adjustments.has_adjustments()
+
+    desc = _description(generate(adjustments))
+    assert desc.get(f"{CRS}GrainAmount") == "10"
+    assert desc.get(f"{CRS}HueAdjustmentAqua") == "-3"
+
+
+def test_generate_hsl_adjustments(generate):
+    """Test HSL adjustments are written per color."""
+    path = generate(
+        LightroomAdjustments(
+            contrast=5,
+            hue_adjustments={"red": 10},
+            saturation_adjustments={"blue": -5},
+            luminance_adjustments={"orange": 0},
+        )
+    )
+    desc = _description(path)
+
+    assert desc.get(f"{CRS}HueAdjustmentRed") == "10"
+    assert desc.get(f"{CRS}SaturationAdjustmentBlue") == "-5"
+    assert desc.get(f"{CRS}LuminanceAdjustmentOrange") == "0"
+
+
+def test_generate_hsl_matches_with_tone_curve(generate):
+    """Test HSL values are written the same with and without a tone curve."""
+    hsl = {
+        "hue_adjustments": {"red": 10, "aqua": 1.5},
+        "saturation_adjustments": {"blue": -5.25},
+        "luminance_adjustments": {"orange": 0},
+    }
+    curve = ToneCurve(points=[(0, 0), (255, 255)])
+
+    def hsl_attribs(path):
+        return {
+            name: value for name, value in _description(path).attrib.items() if "Adjustment" in name
+        }
+
+    plain = hsl_attribs(generate(LightroomAdjustments(**hsl)))
+    curved = hsl_attribs(generate(LightroomAdjustments(tone_curve=curve, **hsl)))
+    assert plain == curved
+    assert plain[f"{CRS}HueAdjustmentAqua"] == "1.5"
+
+
+def test_generate_tone_curve(generate):
+    """Test the tone curve is written as an rdf:Seq with one point per item."""
+    curve = ToneCurve(points=[(0, 0), (64, 80), (255, 255)])
+    desc = _description(generate(LightroomAdjustments(exposure=0.5, tone_curve=curve)))
+
+    items = desc.findall(f"{CRS}ToneCurvePV2012/{RDF}Seq/{RDF}li")
+    assert [item.text for item in items] == ["0, 0", "64, 80", "255, 255"]
+    assert desc.get(f"{CRS}Exposure2012") == "+0.50"
+
+
+@pytest.mark.parametrize("threshold", [xmp.PARALLEL_BATCH_THRESHOLD, 0])
+def test_generate_many(tmp_path, monkeypatch, threshold):
+    """Test batches are written in-process and through the process pool alike."""
+    monkeypatch.setattr(xmp, "PARALLEL_BATCH_THRESHOLD", threshold)
+    curve = ToneCurve(points=[(0, 0), (255, 255)])
+    items = [
+        (
+            LightroomAdjustments(contrast=i, tone_curve=curve if i % 2 else None),
+            PresetMetadata(name=f"P{i}"),
+            tmp_path / f"p{i}.xmp",
+        )
+        for i in range(4)
+    ]
+    XMPGenerator().generate_many(items, max_workers=2)
+
+    for i in range(4):
+        assert _description(tmp_path / f"p{i}.xmp").get(f"{CRS}Contrast2012") == str(i)